@@ -0,0 +1,41 @@
+/*
+ * Licensed to the Apache Software Foundation (ASF) under one or more
+ * contributor license agreements.  See the NOTICE file distributed with
+ * this work for additional information regarding copyright ownership.
+ * The ASF licenses this file to You under the Apache License, Version 2.0
+ * (the "License"); you may not use this file except in compliance with
+ * the License.  You may obtain a copy of the License at
+ *
+ *    http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+package org.apache.spark.api.python
+
+import java.util.{List => JList, Map => JMap}
+
+import org.apache.spark.resource.{ResourceProfile, ResourceProfileBuilder}
+
+private[spark] object PythonResourceProfileUtils {
+
+  /**
+   * Builds a [[ResourceProfile]] directly from plain maps of resource name to request
+   * fields, so that PySpark can turn two dicts into a profile with a single gateway
+   * call instead of driving a builder call by call. The map formats match
+   * [[ResourceProfileBuilder.requireExecutorResources]] and
+   * [[ResourceProfileBuilder.requireTaskResources]].
+   */
+  def buildFromMaps(
+      execRequests: JMap[String, JList[String]],
+      taskRequests: JMap[String, java.lang.Double]): ResourceProfile = {
+    new ResourceProfileBuilder()
+      .requireExecutorResources(execRequests)
+      .requireTaskResources(taskRequests)
+      .build()
+  }
+}
@@ -17,7 +17,8 @@
 
 package org.apache.spark.resource
 
-import java.util.{Map => JMap}
+import java.nio.charset.StandardCharsets
+import java.util.{List => JList, Map => JMap}
 import java.util.concurrent.ConcurrentHashMap
 
 import scala.collection.JavaConverters._
@@ -56,6 +57,25 @@ class ResourceProfileBuilder() {
     _executorResources.asScala.asJava
   }
 
+  /**
+   * (Py4J-specific) serializes the accumulated task resource requests into a single String
+   * so that PySpark can fetch all entries with one gateway call instead of several per
+   * entry. See [[ResourceProfile.serializeTaskResources]] for the format.
+   */
+  private[spark] def taskResourcesSerialized: String = {
+    ResourceProfile.serializeTaskResources(taskResources)
+  }
+
+  /**
+   * (Py4J-specific) returns the accumulated executor resource requests in columnar form:
+   * the names, amounts, discovery scripts and vendors as four parallel columns, each
+   * joined into a `\u0001`-separated String. See
+   * [[ResourceProfile.columnarExecutorResources]].
+   */
+  private[spark] def executorResourcesColumnar: Array[String] = {
+    ResourceProfile.columnarExecutorResources(executorResources)
+  }
+
   /**
    * Add executor resource requests
    * @param requests The detailed executor resource requests, see [[ExecutorResourceRequests]]
@@ -76,6 +96,90 @@ class ResourceProfileBuilder() {
     this
   }
 
+  /**
+   * (Py4J-specific) builds a [[TaskResourceRequests]] from a map of resource name to
+   * amount and adds it, so that PySpark can attach requests accumulated without a
+   * SparkContext in a single gateway call instead of one call per request.
+   */
+  private[spark] def requireTaskResources(requests: JMap[String, java.lang.Double]): this.type = {
+    val treqs = new TaskResourceRequests()
+    requests.asScala.foreach { case (name, amount) =>
+      if (name == ResourceProfile.CPUS) {
+        treqs.cpus(amount.toInt)
+      } else {
+        treqs.resource(name, amount)
+      }
+    }
+    require(treqs)
+  }
+
+  /**
+   * (Py4J-specific) builds an [[ExecutorResourceRequests]] from a map of resource name
+   * to (amount, discoveryScript, vendor) and adds it, so that PySpark can attach
+   * requests accumulated without a SparkContext in a single gateway call. Memory
+   * amounts are in MiB, matching what PySpark tracks locally.
+   */
+  private[spark] def requireExecutorResources(
+      requests: JMap[String, JList[String]]): this.type = {
+    val ereqs = new ExecutorResourceRequests()
+    requests.asScala.foreach { case (name, fields) =>
+      addExecutorRequest(ereqs, name, fields.get(0), fields.get(1), fields.get(2))
+    }
+    require(ereqs)
+  }
+
+  /**
+   * (Py4J-specific) variant of [[requireTaskResources]] taking the requests as one
+   * UTF-8 payload in the format of [[ResourceProfile.serializeTaskResources]]. Py4J
+   * transfers a map with one gateway operation per entry while a byte array crosses
+   * in a single buffered transfer, so PySpark uses this form for large request sets.
+   */
+  private[spark] def requireTaskResourcesFromBytes(payload: Array[Byte]): this.type = {
+    val treqs = new TaskResourceRequests()
+    new String(payload, StandardCharsets.UTF_8).split("\u0002").filter(_.nonEmpty).foreach {
+      entry =>
+        val fields = entry.split("\u0001", -1)
+        val (name, amount) = (fields(0), fields(1).toDouble)
+        if (name == ResourceProfile.CPUS) {
+          treqs.cpus(amount.toInt)
+        } else {
+          treqs.resource(name, amount)
+        }
+    }
+    require(treqs)
+  }
+
+  /**
+   * (Py4J-specific) variant of [[requireExecutorResources]] taking the requests as one
+   * UTF-8 payload with `\u0001` separating the fields (name, amount, discoveryScript,
+   * vendor) of an entry and `\u0002` separating entries, as produced by PySpark.
+   */
+  private[spark] def requireExecutorResourcesFromBytes(payload: Array[Byte]): this.type = {
+    val ereqs = new ExecutorResourceRequests()
+    new String(payload, StandardCharsets.UTF_8).split("\u0002").filter(_.nonEmpty).foreach {
+      entry =>
+        val fields = entry.split("\u0001", -1)
+        addExecutorRequest(ereqs, fields(0), fields(1), fields(2), fields(3))
+    }
+    require(ereqs)
+  }
+
+  private def addExecutorRequest(
+      ereqs: ExecutorResourceRequests,
+      name: String,
+      amount: String,
+      discoveryScript: String,
+      vendor: String): Unit = {
+    name match {
+      case ResourceProfile.MEMORY => ereqs.memory(amount)
+      case ResourceProfile.OVERHEAD_MEM => ereqs.memoryOverhead(amount)
+      case ResourceProfile.PYSPARK_MEM => ereqs.pysparkMemory(amount)
+      case ResourceProfile.OFFHEAP_MEM => ereqs.offHeapMemory(amount)
+      case ResourceProfile.CORES => ereqs.cores(amount.toInt)
+      case _ => ereqs.resource(name, amount.toLong, discoveryScript, vendor)
+    }
+  }
+
   def clearExecutorResourceRequests(): this.type = {
     _executorResources.clear()
     this
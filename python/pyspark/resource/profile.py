@@ -15,16 +15,132 @@
 # limitations under the License.
 #
 
-from typing import overload, Dict, Union, Optional
-from py4j.java_gateway import JavaObject
+import sys
+from types import MappingProxyType
+from typing import overload, Callable, Dict, Mapping, Union, Optional, TYPE_CHECKING
 
 from pyspark.resource.requests import (
     TaskResourceRequest,
     TaskResourceRequests,
     ExecutorResourceRequests,
     ExecutorResourceRequest,
+    _get_jvm_handles,
 )
 
+if TYPE_CHECKING:
+    from py4j.java_gateway import JavaObject, JVMView
+
+
+# Py4J converts a dict argument with one gateway operation per entry. Above this many
+# requests it is cheaper to ship them as a single serialized byte payload instead.
+_REQUESTS_BYTES_THRESHOLD = 16
+
+# The JVM view of the running gateway, cached after the first SparkContext startup.
+_cached_jvm = None
+
+
+def _get_jvm() -> Optional["JVMView"]:
+    """
+    Returns the active JVM view, or None if no SparkContext has been started. The
+    first non-None result is cached so later calls skip the SparkContext import and
+    class-attribute lookup.
+    """
+    global _cached_jvm
+    if _cached_jvm is None:
+        from pyspark.context import SparkContext
+
+        # TODO: ignore[attr-defined] will be removed, once SparkContext is inlined
+        _cached_jvm = SparkContext._jvm  # type: ignore[attr-defined]
+    return _cached_jvm
+
+
+def _serialize_task_resources(requests: Dict[str, TaskResourceRequest]) -> bytearray:
+    """
+    Serializes task resource requests into the single byte payload understood by the
+    JVM builder, with the same layout as :func:`_parse_task_resources` encoded as
+    UTF-8.
+    """
+    return bytearray(
+        "\x02".join("%s\x01%s" % (name, r.amount) for name, r in requests.items()), "utf-8"
+    )
+
+
+def _serialize_executor_resources(requests: Dict[str, ExecutorResourceRequest]) -> bytearray:
+    """
+    Serializes executor resource requests into the single byte payload understood by
+    the JVM builder, with the same layout as :func:`_parse_executor_resources` encoded
+    as UTF-8.
+    """
+    return bytearray(
+        "\x02".join(
+            "\x01".join((name, str(r.amount), r.discoveryScript, r.vendor))
+            for name, r in requests.items()
+        ),
+        "utf-8",
+    )
+
+
+def _parse_task_resources(serialized: str) -> Dict[str, TaskResourceRequest]:
+    """
+    Parses the single-string form of task resource requests produced by the JVM side
+    (entries separated by "\\x02", fields within an entry by "\\x01"). Fetching one
+    serialized string costs a single Py4J round trip, where reading the entries of a
+    Java map costs several round trips per entry.
+    """
+    if not serialized:
+        return {}
+    _TRR = TaskResourceRequest
+    _intern = sys.intern
+    # Resource names like "cpus" or "gpu" recur across profiles; interning them lets
+    # all decoded requests share one string object per name and turns later dict
+    # lookups keyed on them into pointer comparisons.
+    return {
+        _intern(name): _TRR(_intern(name), float(amount))
+        for name, amount in (entry.split("\x01") for entry in serialized.split("\x02"))
+    }
+
+
+def _parse_executor_resources(serialized: str) -> Dict[str, ExecutorResourceRequest]:
+    """
+    Parses the single-string form of executor resource requests produced by the JVM
+    side, with the same layout as :func:`_parse_task_resources` but four fields
+    (name, amount, discoveryScript, vendor) per entry.
+    """
+    if not serialized:
+        return {}
+    _ERR = ExecutorResourceRequest
+    _intern = sys.intern
+    return {
+        _intern(name): _ERR(_intern(name), int(amount), discoveryScript, vendor)
+        for name, amount, discoveryScript, vendor in (
+            entry.split("\x01") for entry in serialized.split("\x02")
+        )
+    }
+
+
+def _decode_executor_resources_columnar(
+    columns: "JavaObject",
+) -> Dict[str, ExecutorResourceRequest]:
+    """
+    Decodes the columnar form of executor resource requests produced by the JVM side:
+    four parallel columns (names, amounts, discovery scripts, vendors), each joined
+    into one "\\x01"-separated string. Reading four fixed-size columns keeps the
+    gateway traffic constant no matter how many resources the profile holds.
+    """
+    names = columns[0]
+    if not names:
+        return {}
+    _ERR = ExecutorResourceRequest
+    return {
+        name: _ERR(name, int(amount), discoveryScript, vendor)
+        for name, amount, discoveryScript, vendor in zip(
+            map(sys.intern, names.split("\x01")),
+            columns[1].split("\x01"),
+            columns[2].split("\x01"),
+            columns[3].split("\x01"),
+        )
+    }
+
 
 class ResourceProfile:
 
@@ -41,8 +157,16 @@ class ResourceProfile:
     This API is evolving.
     """
 
+    __slots__ = (
+        "_java_resource_profile",
+        "_executor_resource_requests",
+        "_task_resource_requests",
+        "_task_cache",
+        "_exec_cache",
+    )
+
     @overload
-    def __init__(self, _java_resource_profile: JavaObject):
+    def __init__(self, _java_resource_profile: "JavaObject"):
         ...
 
     @overload
@@ -56,10 +180,14 @@ class ResourceProfile:
 
     def __init__(
         self,
-        _java_resource_profile: Optional[JavaObject] = None,
+        _java_resource_profile: Optional["JavaObject"] = None,
         _exec_req: Optional[Dict[str, ExecutorResourceRequest]] = None,
         _task_req: Optional[Dict[str, TaskResourceRequest]] = None,
     ):
+        # Read-only views over the resource maps, memoized on first access since the
+        # profile is immutable once built.
+        self._task_cache: Optional[Mapping[str, TaskResourceRequest]] = None
+        self._exec_cache: Optional[Mapping[str, ExecutorResourceRequest]] = None
         if _java_resource_profile is not None:
             self._java_resource_profile = _java_resource_profile
         else:
@@ -67,6 +195,39 @@ class ResourceProfile:
             self._executor_resource_requests = _exec_req or {}
             self._task_resource_requests = _task_req or {}
 
+    @classmethod
+    def from_dicts(
+        cls,
+        exec_req: Optional[Dict[str, ExecutorResourceRequest]] = None,
+        task_req: Optional[Dict[str, TaskResourceRequest]] = None,
+    ) -> "ResourceProfile":
+        """
+        Builds a :class:`ResourceProfile` directly from dicts of resource name to
+        :class:`ExecutorResourceRequest` / :class:`TaskResourceRequest`, without going
+        through a :class:`ResourceProfileBuilder`. With a running SparkContext the
+        JVM-side profile is built in a single gateway call.
+
+        .. versionadded:: 3.3.0
+
+        Notes
+        -----
+        This API is evolving.
+        """
+        exec_req = exec_req or {}
+        task_req = task_req or {}
+        jvm = _get_jvm()
+        if jvm is not None:
+            jrp = _get_jvm_handles(jvm).prpu.buildFromMaps(
+                {
+                    name: [str(r.amount), r.discoveryScript, r.vendor]
+                    for name, r in exec_req.items()
+                },
+                {name: r.amount for name, r in task_req.items()},
+            )
+            return cls(_java_resource_profile=jrp)
+        else:
+            return cls(_exec_req=dict(exec_req), _task_req=dict(task_req))
+
     @property
     def id(self) -> int:
         if self._java_resource_profile is not None:
@@ -78,28 +239,30 @@ class ResourceProfile:
             )
 
     @property
-    def taskResources(self) -> Dict[str, TaskResourceRequest]:
-        if self._java_resource_profile is not None:
-            taskRes = self._java_resource_profile.taskResourcesJMap()
-            result = {}
-            for k, v in taskRes.items():
-                result[k] = TaskResourceRequest(v.resourceName(), v.amount())
-            return result
-        else:
-            return self._task_resource_requests
+    def taskResources(self) -> Mapping[str, TaskResourceRequest]:
+        if self._task_cache is None:
+            if self._java_resource_profile is not None:
+                self._task_cache = MappingProxyType(
+                    _parse_task_resources(self._java_resource_profile.taskResourcesSerialized())
+                )
+            else:
+                # A zero-copy read-only view, so callers cannot mutate the profile's
+                # internal state through the returned mapping.
+                self._task_cache = MappingProxyType(self._task_resource_requests)
+        return self._task_cache
 
     @property
-    def executorResources(self) -> Dict[str, ExecutorResourceRequest]:
-        if self._java_resource_profile is not None:
-            execRes = self._java_resource_profile.executorResourcesJMap()
-            result = {}
-            for k, v in execRes.items():
-                result[k] = ExecutorResourceRequest(
-                    v.resourceName(), v.amount(), v.discoveryScript(), v.vendor()
+    def executorResources(self) -> Mapping[str, ExecutorResourceRequest]:
+        if self._exec_cache is None:
+            if self._java_resource_profile is not None:
+                self._exec_cache = MappingProxyType(
+                    _decode_executor_resources_columnar(
+                        self._java_resource_profile.executorResourcesColumnar()
+                    )
                 )
-            return result
-        else:
-            return self._executor_resource_requests
+            else:
+                self._exec_cache = MappingProxyType(self._executor_resource_requests)
+        return self._exec_cache
 
 
 class ResourceProfileBuilder:
@@ -117,102 +280,152 @@ class ResourceProfileBuilder:
     This API is evolving.
     """
 
-    def __init__(self) -> None:
-        from pyspark.context import SparkContext
+    __slots__ = (
+        "_jvm",
+        "_jvm_mode",
+        "_java_resource_profile_builder",
+        "_executor_resource_requests",
+        "_task_resource_requests",
+        "_dispatch",
+        "_j_require",
+        "_j_clear_exec_reqs",
+        "_j_clear_task_reqs",
+        "_j_require_task_map",
+        "_j_require_exec_map",
+        "_j_require_task_bytes",
+        "_j_require_exec_bytes",
+    )
 
-        # TODO: ignore[attr-defined] will be removed, once SparkContext is inlined
-        _jvm = SparkContext._jvm  # type: ignore[attr-defined]
+    def __init__(self) -> None:
+        _jvm = _get_jvm()
         if _jvm is not None:
             self._jvm = _jvm
-            self._java_resource_profile_builder = (
-                _jvm.org.apache.spark.resource.ResourceProfileBuilder()
+            self._jvm_mode = True
+            self._java_resource_profile_builder = _get_jvm_handles(_jvm).rpb()
+            # Cache the bound Py4J methods used on hot paths so that calling them does
+            # not pay an attribute-resolution round trip on the gateway every time.
+            self._j_require = self._java_resource_profile_builder.require
+            self._j_clear_exec_reqs = (
+                self._java_resource_profile_builder.clearExecutorResourceRequests
+            )
+            self._j_clear_task_reqs = self._java_resource_profile_builder.clearTaskResourceRequests
+            self._j_require_task_map = self._java_resource_profile_builder.requireTaskResources
+            self._j_require_exec_map = (
+                self._java_resource_profile_builder.requireExecutorResources
             )
+            self._j_require_task_bytes = (
+                self._java_resource_profile_builder.requireTaskResourcesFromBytes
+            )
+            self._j_require_exec_bytes = (
+                self._java_resource_profile_builder.requireExecutorResourcesFromBytes
+            )
+            self._dispatch: Dict[type, Callable[..., None]] = {
+                TaskResourceRequests: self._require_task_jvm,
+                ExecutorResourceRequests: self._require_exec_jvm,
+            }
         else:
             self._jvm = None
+            self._jvm_mode = False
             self._java_resource_profile_builder = None
             self._executor_resource_requests: Optional[Dict[str, ExecutorResourceRequest]] = {}
             self._task_resource_requests: Optional[Dict[str, TaskResourceRequest]] = {}
+            self._dispatch = {
+                TaskResourceRequests: self._require_task_local,
+                ExecutorResourceRequests: self._require_exec_local,
+            }
 
-    def require(
-        self, resourceRequest: Union[ExecutorResourceRequest, TaskResourceRequests]
-    ) -> "ResourceProfileBuilder":
-        if isinstance(resourceRequest, TaskResourceRequests):
-            if self._java_resource_profile_builder is not None:
-                if (
-                    resourceRequest._java_task_resource_requests is not None
-                ):  # type: ignore[attr-defined]
-                    self._java_resource_profile_builder.require(
-                        resourceRequest._java_task_resource_requests
-                    )  # type: ignore[attr-defined]
-                else:
-                    taskReqs = TaskResourceRequests(self._jvm, resourceRequest.requests)
-                    self._java_resource_profile_builder.require(
-                        taskReqs._java_task_resource_requests
-                    )  # type: ignore[attr-defined]
+    def _require_task_jvm(self, resourceRequest: TaskResourceRequests) -> None:
+        if resourceRequest._has_java:
+            self._j_require(resourceRequest._java_task_resource_requests)
+        else:
+            # Requests accumulated without a SparkContext: ship them in one gateway
+            # call and let the JVM build and attach the TaskResourceRequests. Large
+            # request sets go as a single byte payload since Py4J converts a dict
+            # entry by entry.
+            requests = resourceRequest.requests
+            if len(requests) > _REQUESTS_BYTES_THRESHOLD:
+                self._j_require_task_bytes(_serialize_task_resources(requests))
             else:
-                self._task_resource_requests.update(  # type: ignore[union-attr]
-                    resourceRequest.requests
-                )
+                self._j_require_task_map({name: r.amount for name, r in requests.items()})
+
+    def _require_task_local(self, resourceRequest: TaskResourceRequests) -> None:
+        existing = self._task_resource_requests
+        if existing:
+            existing.update(resourceRequest.requests)
         else:
-            if self._java_resource_profile_builder is not None:
-                if (
-                    resourceRequest._java_executor_resource_requests is not None  # type: ignore[attr-defined]
-                ):
-                    self._java_resource_profile_builder.require(
-                        resourceRequest._java_executor_resource_requests  # type: ignore[attr-defined]
-                    )
-                else:
-                    execReqs = ExecutorResourceRequests(
-                        self._jvm, resourceRequest.requests  # type: ignore[attr-defined]
-                    )
-                    self._java_resource_profile_builder.require(
-                        execReqs._java_executor_resource_requests  # type: ignore[attr-defined]
-                    )
+            # First require() on this builder: a flat copy skips re-probing every
+            # entry into the empty dict.
+            self._task_resource_requests = dict(resourceRequest.requests)
+
+    def _require_exec_jvm(self, resourceRequest: ExecutorResourceRequests) -> None:
+        if resourceRequest._has_java:
+            self._j_require(resourceRequest._java_executor_resource_requests)
+        else:
+            requests = resourceRequest.requests
+            if len(requests) > _REQUESTS_BYTES_THRESHOLD:
+                self._j_require_exec_bytes(_serialize_executor_resources(requests))
             else:
-                self._executor_resource_requests.update(  # type: ignore[union-attr]
-                    resourceRequest.requests  # type: ignore[attr-defined]
+                self._j_require_exec_map(
+                    {
+                        name: [str(r.amount), r.discoveryScript, r.vendor]
+                        for name, r in requests.items()
+                    }
                 )
+
+    def _require_exec_local(self, resourceRequest: ExecutorResourceRequests) -> None:
+        existing = self._executor_resource_requests
+        if existing:
+            existing.update(resourceRequest.requests)
+        else:
+            self._executor_resource_requests = dict(resourceRequest.requests)
+
+    def require(
+        self, resourceRequest: Union[ExecutorResourceRequest, TaskResourceRequests]
+    ) -> "ResourceProfileBuilder":
+        handler = self._dispatch.get(type(resourceRequest))
+        if handler is None:
+            # Subclasses of the request types still dispatch to the matching handler.
+            handler = self._dispatch[
+                TaskResourceRequests
+                if isinstance(resourceRequest, TaskResourceRequests)
+                else ExecutorResourceRequests
+            ]
+        handler(resourceRequest)
         return self
 
     def clearExecutorResourceRequests(self) -> None:
-        if self._java_resource_profile_builder is not None:
-            self._java_resource_profile_builder.clearExecutorResourceRequests()
+        if self._jvm_mode:
+            self._j_clear_exec_reqs()
         else:
             self._executor_resource_requests = {}
 
     def clearTaskResourceRequests(self) -> None:
-        if self._java_resource_profile_builder is not None:
-            self._java_resource_profile_builder.clearTaskResourceRequests()
+        if self._jvm_mode:
+            self._j_clear_task_reqs()
         else:
             self._task_resource_requests = {}
 
     @property
     def taskResources(self) -> Optional[Dict[str, TaskResourceRequest]]:
-        if self._java_resource_profile_builder is not None:
-            taskRes = self._java_resource_profile_builder.taskResourcesJMap()
-            result = {}
-            for k, v in taskRes.items():
-                result[k] = TaskResourceRequest(v.resourceName(), v.amount())
-            return result
+        if self._jvm_mode:
+            return _parse_task_resources(
+                self._java_resource_profile_builder.taskResourcesSerialized()
+            )
         else:
             return self._task_resource_requests
 
     @property
     def executorResources(self) -> Optional[Dict[str, ExecutorResourceRequest]]:
-        if self._java_resource_profile_builder is not None:
-            result = {}
-            execRes = self._java_resource_profile_builder.executorResourcesJMap()
-            for k, v in execRes.items():
-                result[k] = ExecutorResourceRequest(
-                    v.resourceName(), v.amount(), v.discoveryScript(), v.vendor()
-                )
-            return result
+        if self._jvm_mode:
+            return _decode_executor_resources_columnar(
+                self._java_resource_profile_builder.executorResourcesColumnar()
+            )
         else:
             return self._executor_resource_requests
 
     @property
     def build(self) -> ResourceProfile:
-        if self._java_resource_profile_builder is not None:
+        if self._jvm_mode:
             jresourceProfile = self._java_resource_profile_builder.build()
             return ResourceProfile(_java_resource_profile=jresourceProfile)
         else:
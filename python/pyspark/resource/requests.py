@@ -14,12 +14,41 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from typing import overload, Optional, Dict
-
-from py4j.java_gateway import JavaObject, JVMView
+import operator
+import sys
+from types import SimpleNamespace
+from typing import overload, Optional, Dict, TYPE_CHECKING
 
 from pyspark.util import _parse_memory  # type: ignore[attr-defined]
 
+if TYPE_CHECKING:
+    from py4j.java_gateway import JavaObject, JVMView
+
+# Pre-resolved JVM class handles shared by the resource-profile classes. Resolving a
+# class on the JVMView triggers a reflection search over the gateway, so only the
+# first lookup per process pays that cost; afterwards this is a plain attribute read.
+_jvm_handles = None
+
+# Attribute access on a Py4J JavaObject allocates a fresh JavaMember proxy each time.
+# These methodcaller objects are built once and reused, saving that allocation for
+# every entry in the decode loops below (the gateway round trip itself remains).
+_j_resource_name = operator.methodcaller("resourceName")
+_j_amount = operator.methodcaller("amount")
+_j_discovery_script = operator.methodcaller("discoveryScript")
+_j_vendor = operator.methodcaller("vendor")
+
+
+def _get_jvm_handles(jvm: "JVMView") -> SimpleNamespace:
+    global _jvm_handles
+    if _jvm_handles is None:
+        _jvm_handles = SimpleNamespace(
+            rpb=getattr(jvm, "org.apache.spark.resource.ResourceProfileBuilder"),
+            trr=getattr(jvm, "org.apache.spark.resource.TaskResourceRequests"),
+            err=getattr(jvm, "org.apache.spark.resource.ExecutorResourceRequests"),
+            prpu=getattr(jvm, "org.apache.spark.api.python.PythonResourceProfileUtils"),
+        )
+    return _jvm_handles
+
 
 class ExecutorResourceRequest:
     """
@@ -115,7 +144,7 @@ class ExecutorResourceRequests:
     _OFFHEAP_MEM = "offHeap"
 
     @overload
-    def __init__(self, _jvm: JVMView):
+    def __init__(self, _jvm: "JVMView"):
         ...
 
     @overload
@@ -128,16 +157,18 @@ class ExecutorResourceRequests:
 
     def __init__(
         self,
-        _jvm: Optional[JVMView] = None,
+        _jvm: Optional["JVMView"] = None,
         _requests: Optional[Dict[str, ExecutorResourceRequest]] = None,
     ):
         from pyspark import SparkContext
 
         _jvm = _jvm or SparkContext._jvm  # type: ignore[attr-defined]
         if _jvm is not None:
-            self._java_executor_resource_requests = (
-                _jvm.org.apache.spark.resource.ExecutorResourceRequests()
-            )
+            # Cached as a plain boolean so hot callers such as
+            # ResourceProfileBuilder.require() can branch without re-checking the
+            # Py4J handle.
+            self._has_java = True
+            self._java_executor_resource_requests = _get_jvm_handles(_jvm).err()
             if _requests is not None:
                 for k, v in _requests.items():
                     if k == self._MEMORY:
@@ -153,6 +184,7 @@ class ExecutorResourceRequests:
                             v.resourceName, v.amount, v.discoveryScript, v.vendor
                         )
         else:
+            self._has_java = False
             self._java_executor_resource_requests = None
             self._executor_resources: Dict[str, ExecutorResourceRequest] = {}
 
@@ -219,13 +251,17 @@ class ExecutorResourceRequests:
     @property
     def requests(self) -> Dict[str, ExecutorResourceRequest]:
         if self._java_executor_resource_requests is not None:
-            result = {}
-            execRes = self._java_executor_resource_requests.requestsJMap()
-            for k, v in execRes.items():
-                result[k] = ExecutorResourceRequest(
-                    v.resourceName(), v.amount(), v.discoveryScript(), v.vendor()
+            _ERR = ExecutorResourceRequest
+            _intern = sys.intern
+            return {
+                _intern(k): _ERR(
+                    _intern(_j_resource_name(v)),
+                    _j_amount(v),
+                    _j_discovery_script(v),
+                    _j_vendor(v),
                 )
-            return result
+                for k, v in self._java_executor_resource_requests.requestsJMap().items()
+            }
         else:
             return self._executor_resources
 
@@ -284,7 +320,7 @@ class TaskResourceRequests:
     _CPUS = "cpus"
 
     @overload
-    def __init__(self, _jvm: JVMView):
+    def __init__(self, _jvm: "JVMView"):
         ...
 
     @overload
@@ -297,19 +333,17 @@ class TaskResourceRequests:
 
     def __init__(
         self,
-        _jvm: Optional[JVMView] = None,
+        _jvm: Optional["JVMView"] = None,
         _requests: Optional[Dict[str, TaskResourceRequest]] = None,
     ):
         from pyspark import SparkContext
 
         _jvm = _jvm or SparkContext._jvm  # type: ignore[attr-defined]
         if _jvm is not None:
-            assert SparkContext._jvm is not None
-            self._java_task_resource_requests: Optional[
-                JavaObject
-            ] = (
-                SparkContext._jvm.org.apache.spark.resource.TaskResourceRequests()  # type: ignore[attr-defined]
-            )
+            self._has_java = True
+            self._java_task_resource_requests: Optional["JavaObject"] = _get_jvm_handles(
+                _jvm
+            ).trr()
             if _requests is not None:
                 for k, v in _requests.items():
                     if k == self._CPUS:
@@ -317,6 +351,7 @@ class TaskResourceRequests:
                     else:
                         self._java_task_resource_requests.resource(v.resourceName, v.amount)
         else:
+            self._has_java = False
             self._java_task_resource_requests = None
             self._task_resources: Dict[str, TaskResourceRequest] = {}
 
@@ -337,10 +372,11 @@ class TaskResourceRequests:
     @property
     def requests(self) -> Dict[str, TaskResourceRequest]:
         if self._java_task_resource_requests is not None:
-            result = {}
-            taskRes = self._java_task_resource_requests.requestsJMap()
-            for k, v in taskRes.items():
-                result[k] = TaskResourceRequest(v.resourceName(), v.amount())
-            return result
+            _TRR = TaskResourceRequest
+            _intern = sys.intern
+            return {
+                _intern(k): _TRR(_intern(_j_resource_name(v)), _j_amount(v))
+                for k, v in self._java_task_resource_requests.requestsJMap().items()
+            }
         else:
             return self._task_resources
@@ -17,9 +17,76 @@
 import unittest
 
 from pyspark.resource import ExecutorResourceRequests, ResourceProfileBuilder, TaskResourceRequests
+from pyspark.resource.profile import (
+    ResourceProfile,
+    _decode_executor_resources_columnar,
+    _parse_executor_resources,
+    _parse_task_resources,
+    _serialize_executor_resources,
+    _serialize_task_resources,
+)
 
 
 class ResourceProfileTests(unittest.TestCase):
+    def test_from_dicts_before_sc(self):
+        treqs = TaskResourceRequests().cpus(2).requests
+        ereqs = ExecutorResourceRequests().cores(4).requests
+        rp = ResourceProfile.from_dicts(ereqs, treqs)
+        self.assertEqual(rp.taskResources["cpus"].amount, 2.0)
+        self.assertEqual(rp.executorResources["cores"].amount, 4)
+        self.assertEqual(ResourceProfile.from_dicts().taskResources, {})
+
+    def test_profile_resources_read_only(self):
+        treqs = TaskResourceRequests().cpus(2).requests
+        rp = ResourceProfile.from_dicts(task_req=treqs)
+        with self.assertRaises(TypeError):
+            rp.taskResources["cpus"] = None
+        with self.assertRaises(TypeError):
+            rp.executorResources["cores"] = None
+
+    def test_serialize_resources_round_trip(self):
+        treqs = TaskResourceRequests().cpus(2).resource("gpu", 0.5).requests
+        parsed = _parse_task_resources(_serialize_task_resources(treqs).decode("utf-8"))
+        self.assertEqual(
+            {k: (v.resourceName, v.amount) for k, v in parsed.items()},
+            {k: (v.resourceName, v.amount) for k, v in treqs.items()},
+        )
+        ereqs = ExecutorResourceRequests().cores(2).resource("gpu", 2, "testGpus", "nvidia.com")
+        parsed = _parse_executor_resources(_serialize_executor_resources(ereqs.requests).decode())
+        self.assertEqual(
+            {k: (v.resourceName, v.amount, v.discoveryScript, v.vendor) for k, v in parsed.items()},
+            {
+                k: (v.resourceName, v.amount, v.discoveryScript, v.vendor)
+                for k, v in ereqs.requests.items()
+            },
+        )
+
+    def test_parse_serialized_resources(self):
+        self.assertEqual(_parse_task_resources(""), {})
+        self.assertEqual(_parse_executor_resources(""), {})
+        task_reqs = _parse_task_resources("cpus\x012.0\x02gpu\x010.5")
+        self.assertEqual(len(task_reqs), 2)
+        self.assertEqual(task_reqs["cpus"].amount, 2.0)
+        self.assertEqual(task_reqs["gpu"].amount, 0.5)
+        exec_reqs = _parse_executor_resources(
+            "cores\x012\x01\x01\x02gpu\x012\x01testGpus\x01nvidia.com"
+        )
+        self.assertEqual(len(exec_reqs), 2)
+        self.assertEqual(exec_reqs["cores"].amount, 2)
+        self.assertEqual(exec_reqs["gpu"].discoveryScript, "testGpus")
+        self.assertEqual(exec_reqs["gpu"].vendor, "nvidia.com")
+
+    def test_decode_executor_resources_columnar(self):
+        self.assertEqual(_decode_executor_resources_columnar(["", "", "", ""]), {})
+        decoded = _decode_executor_resources_columnar(
+            ["cores\x01gpu", "2\x014", "\x01testGpus", "\x01nvidia.com"]
+        )
+        self.assertEqual(len(decoded), 2)
+        self.assertEqual(decoded["cores"].amount, 2)
+        self.assertEqual(decoded["gpu"].amount, 4)
+        self.assertEqual(decoded["gpu"].discoveryScript, "testGpus")
+        self.assertEqual(decoded["gpu"].vendor, "nvidia.com")
+
     def test_profile_before_sc(self):
         rpb = ResourceProfileBuilder()
         ereqs = ExecutorResourceRequests().cores(2).memory("6g").memoryOverhead("1g")